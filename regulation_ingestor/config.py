@@ -3,30 +3,30 @@
 import os
 import json
 from pathlib import Path
-from typing import Optional
-from pydantic import BaseModel, Field, HttpUrl
-from dotenv import load_dotenv
+from typing import TYPE_CHECKING, Optional
 
-# Load environment variables from .env file
-load_dotenv()
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
-class RegulationSource(BaseModel):
-    """Source configuration for a regulation."""
-    id: str
-    sources: list[str] = Field(default_factory=list)
+# Pydantic and python-dotenv are imported on first use, so commands that never
+# touch regions.json or the environment (e.g. --help) don't pay for them.
+if TYPE_CHECKING:
+    from .processors.validator import Region, RegionsConfig, RegulationSource
 
 
-class Region(BaseModel):
-    """Region configuration with its regulations."""
-    id: str
-    name: str
-    regulations: list[RegulationSource] = Field(default_factory=list)
-
-
-class RegionsConfig(BaseModel):
-    """Root configuration for all regions."""
-    regions: list[Region] = Field(default_factory=list)
+def __getattr__(name: str):
+    """Expose the regions models, which are defined in processors.validator."""
+    if name in ("RegulationSource", "Region", "RegionsConfig"):
+        from .processors import validator
+        return getattr(validator, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class Config:
@@ -40,7 +40,12 @@ class Config:
             data_dir: Override for REGULATION_DATA_DIR environment variable
         """
         # Get data directory from parameter, environment variable, or default
-        env_data_dir = os.getenv("REGULATION_DATA_DIR")
+        env_data_dir = None
+        if not data_dir:
+            # Load environment variables from .env file
+            from dotenv import load_dotenv
+            load_dotenv()
+            env_data_dir = os.getenv("REGULATION_DATA_DIR")
         
         if data_dir:
             # Explicit override takes precedence
@@ -56,43 +61,74 @@ class Config:
         
         # Load regions.json from data directory
         self.regions_file = self.data_dir / "regions.json"
-        self._regions_config: Optional[RegionsConfig] = None
+        self._regions_config: Optional["RegionsConfig"] = None
+        self._region_by_id: dict[str, Region] = {}
+        self._regulation_by_key: dict[tuple[str, str], RegulationSource] = {}
     
-    def load_regions(self) -> RegionsConfig:
+    def load_regions(self) -> "RegionsConfig":
         """Load and parse regions.json."""
         if self._regions_config is not None:
             return self._regions_config
         
+        self._check_regions_file()
+        
+        if orjson is not None:
+            data = orjson.loads(self.regions_file.read_bytes())
+        else:
+            with open(self.regions_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        
+        from .processors.validator import RegionsConfig
+        self._regions_config = RegionsConfig.model_validate(data)
+        
+        # Index regions and regulations by ID for constant-time lookups
+        # (the first entry wins if an ID is repeated)
+        for region in self._regions_config.regions:
+            self._region_by_id.setdefault(region.id, region)
+        for region in self._region_by_id.values():
+            for regulation in region.regulations:
+                self._regulation_by_key.setdefault((region.id, regulation.id), regulation)
+        
+        return self._regions_config
+    
+    def _check_regions_file(self):
+        """Raise a helpful error if regions.json has not been created yet."""
         if not self.regions_file.exists():
             raise FileNotFoundError(
                 f"regions.json not found at {self.regions_file}. "
                 f"Run 'python main.py init' to initialize."
             )
+    
+    def get_region_lazy(self, region_id: str) -> Optional["Region"]:
+        """
+        Get a specific region by ID without loading all of regions.json.
         
-        with open(self.regions_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        With ijson installed, the file is streamed and parsing stops at the
+        first matching region, which keeps single-region lookups cheap on very
+        large configurations. Otherwise (or if the file is already loaded) this
+        is the same as get_region.
+        """
+        if ijson is None or self._regions_config is not None:
+            return self.get_region(region_id)
         
-        self._regions_config = RegionsConfig(**data)
-        return self._regions_config
+        from .processors.validator import Region
+        
+        self._check_regions_file()
+        with open(self.regions_file, "rb") as f:
+            for region in ijson.items(f, "regions.item"):
+                if region["id"] == region_id:
+                    return Region.model_validate(region)
+        return None
     
-    def get_region(self, region_id: str) -> Optional[Region]:
+    def get_region(self, region_id: str) -> Optional["Region"]:
         """Get a specific region by ID."""
-        config = self.load_regions()
-        for region in config.regions:
-            if region.id == region_id:
-                return region
-        return None
+        self.load_regions()
+        return self._region_by_id.get(region_id)
     
-    def get_regulation(self, region_id: str, regulation_id: str) -> Optional[RegulationSource]:
+    def get_regulation(self, region_id: str, regulation_id: str) -> Optional["RegulationSource"]:
         """Get a specific regulation by region and regulation ID."""
-        region = self.get_region(region_id)
-        if not region:
-            return None
-        
-        for regulation in region.regulations:
-            if regulation.id == regulation_id:
-                return regulation
-        return None
+        self.load_regions()
+        return self._regulation_by_key.get((region_id, regulation_id))
     
     def get_regulation_path(self, region_id: str, regulation_id: str) -> Path:
         """Get the path where a regulation JSON file should be stored."""
@@ -1,131 +1,228 @@
 """Main CLI entrypoint for regulation data ingestor."""
 
 import argparse
+import importlib.util
+import io
+import multiprocessing
 import sys
-from pathlib import Path
-from typing import Optional
+import traceback
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Optional, TextIO
 
 from .config import Config
-from .sources.fallback import Scraper
-from .processors.normalizer import Normalizer
-from .processors.extractor import Extractor
-from .processors.validator import Regulation
-from .writers.output import OutputWriter
 
+# The pipeline modules (scraper, parsers, Pydantic models, writers) are imported
+# inside the commands that use them, so '--help' and usage errors start fast.
 
-def update_regulation(config: Config, region_id: str, regulation_id: str, dry_run: bool = False, verbose: bool = False):
+# Number of regulations processed concurrently by 'update all'
+DEFAULT_WORKERS = 8
+
+# Worker processes for text processing in 'update all' (0 processes in-thread)
+DEFAULT_PROCESSES = 0
+
+# Full names for known regulation IDs
+_REGULATION_NAMES = MappingProxyType({
+    "gdpr": "General Data Protection Regulation",
+    "dora": "Digital Operational Resilience Act",
+    "hipaa": "Health Insurance Portability and Accountability Act",
+    "ccpa": "California Consumer Privacy Act",
+    "glba": "Gramm-Leach-Bliley Act",
+    "lgpd": "Lei Geral de Proteção de Dados",
+})
+
+
+def update_regulation(config: Config, region_id: str, regulation_id: str, dry_run: bool = False, verbose: bool = False,
+                      out: Optional[TextIO] = None, *, scraper=None, normalizer=None, extractor=None, writer=None,
+                      process_pool: Optional[Executor] = None, compress_versions: bool = False):
     """
     Update a single regulation.
     
+    The pipeline components can be passed in so a batch run shares one of each
+    (and with it the scraper's HTTP connection pool); any left as None are
+    created for this call.
+    
     Args:
         config: Application configuration
         region_id: Region identifier
         regulation_id: Regulation identifier
         dry_run: If True, validate without writing files
         verbose: If True, print detailed output
+        out: Stream for progress output (defaults to stdout)
+        scraper: Shared Scraper instance
+        normalizer: Shared Normalizer instance
+        extractor: Shared Extractor instance
+        writer: Shared OutputWriter instance
+        process_pool: Executor to run normalization and extraction in, e.g. a
+            process pool so the CPU-bound regex work runs outside the GIL
+        compress_versions: If True, zstd-compress the versioned file (used
+            when no writer is passed in)
     """
     if verbose:
-        print(f"Updating {region_id}/{regulation_id}...")
+        print(f"Updating {region_id}/{regulation_id}...", file=out)
     
-    # Get regulation configuration
-    regulation_config = config.get_regulation(region_id, regulation_id)
+    # Get regulation configuration. A single update streams regions.json only
+    # up to its region; in a batch run the file is already loaded.
+    region = config.get_region_lazy(region_id)
+    regulation_config = None
+    if region is not None:
+        regulation_config = next(
+            (regulation for regulation in region.regulations if regulation.id == regulation_id),
+            None,
+        )
     if not regulation_config:
-        print(f"Error: Regulation {region_id}/{regulation_id} not found in regions.json")
-        return False
-    
-    region = config.get_region(region_id)
-    if not region:
-        print(f"Error: Region {region_id} not found in regions.json")
+        print(f"Error: Regulation {region_id}/{regulation_id} not found in regions.json", file=out)
         return False
     
     if not regulation_config.sources:
-        print(f"Warning: No sources configured for {region_id}/{regulation_id}")
+        print(f"Warning: No sources configured for {region_id}/{regulation_id}", file=out)
         return False
     
     try:
-        # Step 1: Scrape content
-        if verbose:
-            print(f"  Scraping from {len(regulation_config.sources)} source(s)...")
-        scraper = Scraper()
-        raw_text = scraper.scrape(region_id, regulation_id, regulation_config.sources)
+        from .processors.validator import Regulation
+        
+        if scraper is None:
+            from .sources.fallback import Scraper
+            scraper = Scraper()
+        if normalizer is None:
+            from .processors.normalizer import Normalizer
+            normalizer = Normalizer()
+        if extractor is None:
+            from .processors.extractor import Extractor
+            extractor = Extractor()
         
+        # Step 1: Scrape content
         if verbose:
-            print(f"  Extracted {len(raw_text)} characters")
+            print(f"  Scraping from {len(regulation_config.sources)} source(s)...", file=out)
+        raw_text = scraper.scrape(region_id, regulation_id, regulation_config.sources, out=out)
         
-        # Step 2: Normalize text
         if verbose:
-            print("  Normalizing text...")
-        normalizer = Normalizer()
-        normalized_text = normalizer.normalize(raw_text)
+            print(f"  Extracted {len(raw_text)} characters", file=out)
         
-        # Step 3: Extract structured content
+        # Steps 2-3: Normalize text and extract structured content
         if verbose:
-            print("  Extracting structured content...")
-        extractor = Extractor()
-        articles = extractor.extract_articles(normalized_text)
-        summary = extractor.extract_summary(normalized_text)
-        developer_guidance = extractor.extract_developer_guidance(normalized_text)
+            print("  Normalizing text...", file=out)
+            print("  Extracting structured content...", file=out)
+        if process_pool is not None:
+            articles, summary, developer_guidance = process_pool.submit(
+                _process_text, normalizer, extractor, raw_text
+            ).result()
+        else:
+            articles, summary, developer_guidance = _process_text(normalizer, extractor, raw_text)
         
         if verbose:
-            print(f"  Extracted {len(articles)} articles")
+            print(f"  Extracted {len(articles)} articles", file=out)
         
         # Step 4: Create regulation object
-        regulation = Regulation(
-            id=regulation_id,
-            name=_get_regulation_name(regulation_id),
-            region=region.name,
-            risk_category="high",  # Default, can be overridden
-            summary=summary,
-            articles=articles,
-            developer_guidance=developer_guidance
-        )
+        fields = {
+            "id": regulation_id,
+            "name": _get_regulation_name(regulation_id),
+            "region": region.name,
+            "risk_category": "high",  # Default, can be overridden
+            "summary": summary,
+            "articles": articles,
+            "developer_guidance": developer_guidance,
+        }
         
         # Step 5: Validate
         if verbose:
-            print("  Validating schema...")
-        # Validation happens automatically via Pydantic
+            print("  Validating schema...", file=out)
+        regulation = Regulation(**fields)
         
         # Step 6: Write output
         if not dry_run:
             if verbose:
-                print("  Writing files...")
-            writer = OutputWriter(config.data_dir)
-            versioned_path, active_path = writer.write_regulation(regulation, region_id)
-            print(f"✓ Saved versioned file: {versioned_path}")
-            print(f"✓ Updated active file: {active_path}")
+                print("  Writing files...", file=out)
+            own_writer = writer is None
+            if own_writer:
+                from .writers.output import OutputWriter
+                writer = OutputWriter(config.data_dir, compress_versions=compress_versions)
+            try:
+                versioned_path, active_path = writer.write_regulation(regulation, region_id)
+            finally:
+                if own_writer:
+                    writer.close()
+            print(f"✓ Saved versioned file: {versioned_path}", file=out)
+            print(f"✓ Updated active file: {active_path}", file=out)
         else:
-            print("✓ Validation passed (dry-run mode)")
+            print("✓ Validation passed (dry-run mode)", file=out)
         
         return True
         
     except Exception as e:
-        print(f"✗ Error processing {region_id}/{regulation_id}: {e}")
+        print(f"✗ Error processing {region_id}/{regulation_id}: {e}", file=out)
         if verbose:
-            import traceback
-            traceback.print_exc()
+            traceback.print_exc(file=out)
         return False
 
 
-def update_all(config: Config, dry_run: bool = False, verbose: bool = False):
+def update_all(config: Config, dry_run: bool = False, verbose: bool = False, workers: int = DEFAULT_WORKERS,
+               processes: int = DEFAULT_PROCESSES, compress_versions: bool = False):
     """
     Update all regulations.
     
+    Regulations are independent and dominated by network time, so they are
+    processed concurrently on a thread pool. With processes > 0, the CPU-bound
+    normalization and extraction steps run on a process pool of that size.
+    
     Args:
         config: Application configuration
         dry_run: If True, validate without writing files
         verbose: If True, print detailed output
+        workers: Maximum number of regulations processed at once
+        processes: Number of worker processes for text processing (0 to process in-thread)
+        compress_versions: If True, zstd-compress versioned files
     """
+    from .sources.fallback import Scraper
+    from .processors.normalizer import Normalizer
+    from .processors.extractor import Extractor
+    from .writers.output import OutputWriter
+    
     regions_config = config.load_regions()
     
+    # One set of pipeline components for the whole run
+    shared = {
+        "scraper": Scraper(),
+        "normalizer": Normalizer(),
+        "extractor": Extractor(),
+        "writer": None if dry_run else OutputWriter(config.data_dir, compress_versions=compress_versions),
+        # Workers are spawned rather than forked: the pool starts them from the
+        # update threads, and a fork could copy a lock another thread holds
+        "process_pool": (
+            ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn"))
+            if processes > 0 else None
+        ),
+    }
+    
+    def run(region_id: str, regulation_id: str) -> tuple[bool, str]:
+        # Buffer each regulation's output so concurrent updates don't interleave
+        out = io.StringIO()
+        ok = update_regulation(config, region_id, regulation_id, dry_run, verbose, out=out, **shared)
+        return ok, out.getvalue()
+    
     total = 0
     success = 0
     
-    for region in regions_config.regions:
-        for regulation in region.regulations:
-            total += 1
-            if update_regulation(config, region.id, regulation.id, dry_run, verbose):
-                success += 1
-            print()  # Blank line between regulations
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(run, region.id, regulation.id)
+                for region in regions_config.regions
+                for regulation in region.regulations
+            ]
+            # Print results in regions.json order as they become available
+            for future in futures:
+                total += 1
+                ok, output = future.result()
+                if ok:
+                    success += 1
+                print(output, end="")
+                print()  # Blank line between regulations
+    finally:
+        if shared["process_pool"] is not None:
+            shared["process_pool"].shutdown()
+        if shared["writer"] is not None:
+            shared["writer"].close()
     
     print(f"Completed: {success}/{total} regulations updated successfully")
 
@@ -138,6 +235,7 @@ def init_regions(config: Config):
         config: Application configuration
     """
     from .processors.validator import RegionsConfig, Region, RegulationSource
+    from .writers.output import OutputWriter
     
     # Create default regions configuration
     regions_config = RegionsConfig(
@@ -210,17 +308,49 @@ def init_regions(config: Config):
     print(f"✓ Created directory structure at {config.data_dir}")
 
 
+def _process_text(normalizer, extractor, raw_text: str) -> tuple[list, str, list]:
+    """
+    Normalize scraped text and extract its structured content.
+    
+    Module-level so it can run in a worker process; the normalizer and
+    extractor hold no state and pickle cheaply.
+    
+    Returns:
+        Tuple of (articles, summary, developer_guidance)
+    """
+    normalized_text = normalizer.normalize(raw_text)
+    return (
+        extractor.extract_articles(normalized_text),
+        extractor.extract_summary(normalized_text),
+        extractor.extract_developer_guidance(normalized_text),
+    )
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for options that need at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value!r}")
+    return number
+
+
+def _non_negative_int(value: str) -> int:
+    """argparse type for options where 0 disables the feature."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = -1
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or a positive integer, got {value!r}")
+    return number
+
+
 def _get_regulation_name(regulation_id: str) -> str:
     """Get full name for a regulation ID."""
-    names = {
-        "gdpr": "General Data Protection Regulation",
-        "dora": "Digital Operational Resilience Act",
-        "hipaa": "Health Insurance Portability and Accountability Act",
-        "ccpa": "California Consumer Privacy Act",
-        "glba": "Gramm-Leach-Bliley Act",
-        "lgpd": "Lei Geral de Proteção de Dados",
-    }
-    return names.get(regulation_id, regulation_id.upper())
+    return _REGULATION_NAMES.get(regulation_id, regulation_id.upper())
 
 
 def main():
@@ -257,6 +387,24 @@ def main():
         action="store_true",
         help="Print detailed output"
     )
+    update_parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=DEFAULT_WORKERS,
+        help=f"Number of regulations updated concurrently with 'all' (default: {DEFAULT_WORKERS})"
+    )
+    update_parser.add_argument(
+        "--processes",
+        type=_non_negative_int,
+        default=DEFAULT_PROCESSES,
+        help="Worker processes for normalizing and extracting text with 'all' "
+             f"(default: {DEFAULT_PROCESSES}, process in-thread)"
+    )
+    update_parser.add_argument(
+        "--compress-versions",
+        action="store_true",
+        help="Write versioned files zstd-compressed as .json.zst (requires zstandard)"
+    )
     
     # Init command
     init_parser = subparsers.add_parser("init", help="Initialize regions.json")
@@ -271,6 +419,11 @@ def main():
         parser.print_help()
         sys.exit(1)
     
+    if args.command == "update" and args.compress_versions:
+        # Checked up front, so a missing package fails before any scraping
+        if importlib.util.find_spec("zstandard") is None:
+            update_parser.error("--compress-versions requires the zstandard package")
+    
     # Initialize configuration
     config = Config(data_dir=args.data_dir)
     
@@ -279,14 +432,22 @@ def main():
     
     elif args.command == "update":
         if args.region_id == "all":
-            update_all(config, dry_run=args.dry_run, verbose=args.verbose)
+            update_all(
+                config,
+                dry_run=args.dry_run,
+                verbose=args.verbose,
+                workers=args.workers,
+                processes=args.processes,
+                compress_versions=args.compress_versions
+            )
         elif args.region_id and args.regulation_id:
             update_regulation(
                 config,
                 args.region_id,
                 args.regulation_id,
                 dry_run=args.dry_run,
-                verbose=args.verbose
+                verbose=args.verbose,
+                compress_versions=args.compress_versions
             )
         else:
             update_parser.print_help()
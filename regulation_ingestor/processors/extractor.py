@@ -1,82 +1,93 @@
 """Extracts structured content from normalized text."""
 
 import re
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from itertools import islice
+from typing import Iterator, List, Optional, Pattern, Tuple
+
+# Article markers at the start of a line, as a single alternation so the text is
+# scanned once. Lettered forms (55-A, 55 A) come first so they are not cut short
+# by the plain numbered form; the trailing \b keeps a word after the number
+# ("Article 32 Security") from being read as a letter.
+_ARTICLE_RE = re.compile(
+    r'^(?:(?:Art\.\s*|Article\s+)(?P<lettered>\d+[-\s]*[A-Z])\b'
+    r'|(?:Art\.\s*|Article\s+|Section\s+)(?P<number>\d+))',
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Article number normalization ("55  -  A", "55 A" -> "55-A")
+_WHITESPACE_RE = re.compile(r'\s+')
+_HYPHEN_RE = re.compile(r'\s*-\s*')
+_SPACED_LETTER_RE = re.compile(r'\s+([A-Z])')
+
+# Parenthesized metadata and whitespace runs in summary content, both replaced by
+# a single space in one pass
+_METADATA_OR_SPACE_RE = re.compile(r'(?:\s*\([^)]*\)\s*|\s+)+')
+
+# Joined summary content length at which _extract_summary first tries to settle
+# the summary early; doubled after every unsuccessful try
+_SUMMARY_CHECKPOINT = 512
+_SUMMARY_MAX_LENGTH = 500
+
+# End of the first sentence in whitespace-collapsed content
+_SENTENCE_END_RE = re.compile(r'[.!?]\s')
+
+# Title patterns, formatted with the escaped article number
+_TITLE_TEMPLATES = (
+    r'Art\.\s*{num}\.?\s*([^\n]+)',
+    r'Article\s+{num}\.?\s*([^\n]+)',
+    r'Section\s+{num}\.?\s*([^\n]+)',
+)
+
+# Title cleanup: leading/trailing punctuation and trailing metadata such as
+# "(Incluído pela Lei...)"
+_TITLE_LEADING_PUNCT_RE = re.compile(r'^[:\-\s]+')
+_TITLE_TRAILING_PUNCT_RE = re.compile(r'[:\-\s]+$')
+_TRAILING_METADATA_RE = re.compile(r'\s*\([^)]*\)\s*$')
+
+# Introduction/preamble patterns for the overall summary
+_INTRO_RES = (
+    re.compile(r'(?:introduction|preamble|overview|summary)[:\s]+(.+?)(?:\n\n|\n[A-Z])', re.IGNORECASE | re.DOTALL),
+    re.compile(r'^(.{100,500}?)(?:Article|Section|\n\n)', re.IGNORECASE | re.DOTALL),
+)
+
+# Article header and paragraph marker lines, skipped in titles and summaries
+_HEADER_LINE_RE = re.compile(r'^(Article|Art\.|Section|ART\.)\s+\d+', re.IGNORECASE)
+_PARAGRAPH_LINE_RE = re.compile(r'^§\s*\d+')
+
+@lru_cache(maxsize=1024)
+def _title_patterns(article_num: str) -> Tuple[Pattern, ...]:
+    """Compile the title patterns for an article number, once per distinct number."""
+    # Escape the article number but handle hyphens
+    escaped_num = re.escape(article_num).replace(r'\-', r'[-\s]*')
+    return tuple(
+        re.compile(template.format(num=escaped_num), re.IGNORECASE)
+        for template in _TITLE_TEMPLATES
+    )
+
+
+# Basic keyword-based guidance extraction (very simple)
+_GUIDANCE_KEYWORDS = {
+    "encrypt": "Encrypt sensitive data",
+    "access control": "Enforce access control",
+    "minimize": "Minimize personal data storage",
+    "audit": "Maintain audit logs",
+    "consent": "Obtain proper consent",
+}
+
+_GUIDANCE_KEYWORD_BYTES = tuple(
+    (keyword.encode("ascii"), guidance_text)
+    for keyword, guidance_text in _GUIDANCE_KEYWORDS.items()
+)
+
+# Lowercases ASCII letters only. All guidance keywords are ASCII, so there is no
+# need for str.lower()'s per-character Unicode case mapping.
+_ASCII_LOWER = bytes.maketrans(b"ABCDEFGHIJKLMNOPQRSTUVWXYZ", b"abcdefghijklmnopqrstuvwxyz")
 
 
 class Extractor:
     """Extracts articles, summaries, and guidance from text."""
     
-    def __init__(self):
-        """Initialize extractor."""
-        # Patterns for article markers - must be at start of line or after newline
-        # Capture lettered articles like 55-A, 55-B, etc.
-        self.article_patterns = [
-            r'^Art\.\s*(\d+[-\s]*[A-Z])',  # Art. 55-A (at start of line)
-            r'\nArt\.\s*(\d+[-\s]*[A-Z])',  # Art. 55-A (after newline)
-            r'^Article\s+(\d+[-\s]*[A-Z])',  # Article 55-A
-            r'\nArticle\s+(\d+[-\s]*[A-Z])',  # Article 55-A (after newline)
-            r'^ART\.\s*(\d+[-\s]*[A-Z])',  # ART. 55-A
-            r'\nART\.\s*(\d+[-\s]*[A-Z])',  # ART. 55-A (after newline)
-            # Also capture regular numbered articles
-            r'^Art\.\s*(\d+)',  # Art. 32 (at start of line)
-            r'\nArt\.\s*(\d+)(?:\s|\.|$)',  # Art. 32 (after newline, not followed by letter)
-            r'^Article\s+(\d+)',  # Article 32
-            r'\nArticle\s+(\d+)(?:\s|\.|$)',  # Article 32 (after newline)
-            r'^ART\.\s*(\d+)',  # ART. 32
-            r'\nART\.\s*(\d+)(?:\s|\.|$)',  # ART. 32 (after newline)
-            r'^Section\s+(\d+)',  # Section 32
-            r'\nSection\s+(\d+)(?:\s|\.|$)',  # Section 32 (after newline)
-        ]
-        
-        # Pattern to identify paragraph markers (should NOT be treated as articles)
-        self.paragraph_pattern = r'^§\s*\d+[ºª]?'
-        
-        # Pattern to identify article references within text (should be ignored)
-        # These typically appear in lowercase and within sentences
-        self.reference_patterns = [
-            r'[a-z]\s+art\.\s*\d+',  # lowercase "art." after lowercase letter
-            r'do\s+art\.\s*\d+',  # "do art." (Portuguese: "of article")
-            r'da\s+art\.\s*\d+',  # "da art." (Portuguese: "of article")
-            r'nos\s+termos\s+do\s+art\.',  # "nos termos do art." (Portuguese: "in terms of article")
-        ]
-    
-    def _is_article_reference(self, text: str, pos: int) -> bool:
-        """
-        Check if an article marker is actually a reference within text.
-        
-        Args:
-            text: Full text
-            pos: Position of the match
-            
-        Returns:
-            True if this is a reference, False if it's an article header
-        """
-        # Check context before the match
-        if pos > 0:
-            before = text[max(0, pos-50):pos].lower()
-            # If preceded by lowercase text or common reference phrases, it's likely a reference
-            for ref_pattern in self.reference_patterns:
-                if re.search(ref_pattern, before):
-                    return True
-            # If preceded by lowercase letter (not newline/start), likely a reference
-            if pos > 0 and text[pos-1].islower():
-                return True
-        
-        # Check if it's at start of line (more likely to be a header)
-        line_start = text.rfind('\n', 0, pos) + 1
-        if pos == line_start or pos == line_start + 1:  # Allow for one space
-            return False
-        
-        # Check if preceded by sentence-ending punctuation followed by space
-        if pos > 2:
-            before_chars = text[max(0, pos-3):pos]
-            if re.match(r'[.!?]\s+$', before_chars):
-                return False
-        
-        # Default: if not clearly a header, be conservative and treat as reference
-        return False
-    
     def _normalize_article_number(self, article_num: str) -> str:
         """
         Normalize article number format.
@@ -88,9 +99,9 @@ class Extractor:
             Normalized article number (e.g., "55-A", "55 A" -> "55-A")
         """
         # Remove extra spaces and normalize hyphens
-        article_num = re.sub(r'\s+', ' ', article_num.strip())
-        article_num = re.sub(r'\s*-\s*', '-', article_num)
-        article_num = re.sub(r'\s+([A-Z])', r'-\1', article_num)
+        article_num = _WHITESPACE_RE.sub(' ', article_num.strip())
+        article_num = _HYPHEN_RE.sub('-', article_num)
+        article_num = _SPACED_LETTER_RE.sub(r'-\1', article_num)
         return article_num
     
     def extract_articles(self, text: str) -> List[dict]:
@@ -103,142 +114,132 @@ class Extractor:
         Returns:
             List of article dictionaries with article number, title, summary, and notes
         """
+        # Markers arrive in text order, so each article is emitted as soon as the
+        # next marker (its end) is seen, in a single pass over the text
         articles = []
-        
-        # Find all article markers
-        article_positions = []
-        for pattern in self.article_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE | re.MULTILINE):
-                article_num = match.group(1)
-                start_pos = match.start()
-                
-                # Skip if this is actually a paragraph marker
-                line_start = text.rfind('\n', 0, start_pos) + 1
-                line_text = text[line_start:start_pos + 50]
-                if re.match(self.paragraph_pattern, line_text, re.IGNORECASE):
-                    continue
-                
-                # Skip if this is an article reference within text
-                if self._is_article_reference(text, start_pos):
-                    continue
-                
-                # Normalize article number
-                article_num = self._normalize_article_number(article_num)
-                
-                article_positions.append((start_pos, article_num, match))
-        
-        # Remove duplicates (same position, same article number)
-        seen = set()
-        unique_positions = []
-        for pos, article_num, match in article_positions:
-            key = (pos, article_num)
-            if key not in seen:
-                seen.add(key)
-                unique_positions.append((pos, article_num, match))
-        
-        # Sort by position
-        unique_positions.sort(key=lambda x: x[0])
-        
-        # Extract content for each article
-        for i, (pos, article_num, match) in enumerate(unique_positions):
-            # Find the end of this article (start of next article or end of text)
-            if i + 1 < len(unique_positions):
-                end_pos = unique_positions[i + 1][0]
-            else:
-                end_pos = len(text)
-            
-            # Extract article content
-            article_text = text[pos:end_pos].strip()
-            
-            # Extract title (usually first line or sentence after article number)
-            title = self._extract_title(article_text, article_num)
-            
-            # Extract summary (first paragraph or first few sentences)
-            summary = self._extract_summary(article_text)
-            
-            articles.append({
-                "article": article_num,
-                "title": title,
-                "summary": summary,
-                "notes": None  # Can be populated later with LLM or manual input
-            })
+        previous = None
+        for marker in self._iter_article_markers(text):
+            if previous is not None:
+                articles.append(self._build_article(text, previous[0], marker[0], previous[1]))
+            previous = marker
+        if previous is not None:
+            articles.append(self._build_article(text, previous[0], len(text), previous[1]))
         
         return articles
     
-    def _extract_title(self, article_text: str, article_num: str) -> str:
-        """Extract article title from article text."""
+    def _iter_article_markers(self, text: str) -> Iterator[Tuple[int, str]]:
+        """Yield (position, normalized article number) for each article header."""
+        # A single finditer yields non-overlapping matches in position order, and
+        # at any position the alternation keeps the first alternative that
+        # matches (the longer lettered form before the plain number), so
+        # overlapping markers are already collapsed to one.
+        for match in _ARTICLE_RE.finditer(text):
+            yield match.start(), self._normalize_article_number(
+                match.group("lettered") or match.group("number")
+            )
+    
+    def _build_article(self, text: str, start: int, end: int, article_num: str) -> dict:
+        """Build the article dictionary for the article spanning text[start:end]."""
+        return {
+            "article": article_num,
+            # Title is usually the first line or sentence after the article number
+            "title": self._extract_title(text, start, end, article_num),
+            # Summary is the first sentence of the article body
+            "summary": self._extract_summary(text, start, end),
+            "notes": None  # Can be populated later with LLM or manual input
+        }
+    
+    def _iter_lines(self, text: str, start: int, end: int):
+        """Yield the lines of text[start:end] without slicing out the range first."""
+        while start <= end:
+            line_end = text.find('\n', start, end)
+            if line_end == -1:
+                line_end = end
+            yield text[start:line_end]
+            start = line_end + 1
+    
+    def _extract_title(self, text: str, start: int, end: int, article_num: str) -> str:
+        """Extract article title from the article spanning text[start:end]."""
         # Look for title patterns - handle lettered articles
-        # Escape the article number but handle hyphens
-        escaped_num = re.escape(article_num).replace(r'\-', r'[-\s]*')
-        title_patterns = [
-            rf'Art\.\s*{escaped_num}\.?\s*([^\n]+)',
-            rf'Article\s+{escaped_num}\.?\s*([^\n]+)',
-            rf'Section\s+{escaped_num}\.?\s*([^\n]+)',
-        ]
-        
-        for pattern in title_patterns:
-            match = re.search(pattern, article_text, re.IGNORECASE)
+        for pattern in _title_patterns(article_num):
+            match = pattern.search(text, start, end)
             if match:
                 title = match.group(1).strip()
                 # Clean up title (remove extra punctuation, normalize)
-                title = re.sub(r'^[:\-\s]+', '', title)
-                title = re.sub(r'[:\-\s]+$', '', title)
+                title = _TITLE_LEADING_PUNCT_RE.sub('', title)
+                title = _TITLE_TRAILING_PUNCT_RE.sub('', title)
                 # Remove metadata like "(Incluído pela Lei...)"
-                title = re.sub(r'\s*\([^)]*\)\s*$', '', title)
+                title = _TRAILING_METADATA_RE.sub('', title)
                 if title and len(title) > 3:
                     return title
         
         # Fallback: use first sentence or first line
-        lines = article_text.split('\n')
-        for line in lines[:5]:  # Check more lines for lettered articles
+        for line in islice(self._iter_lines(text, start, end), 5):  # Check more lines for lettered articles
             line = line.strip()
             # Skip article header, paragraph markers, and empty lines
             if (line and len(line) > 10 and 
-                not re.match(r'^(Article|Art\.|Section|ART\.)\s+\d+', line, re.IGNORECASE) and
-                not re.match(r'^§\s*\d+', line)):
+                not _HEADER_LINE_RE.match(line) and
+                not _PARAGRAPH_LINE_RE.match(line)):
                 # Take first reasonable line as title
                 # Remove trailing metadata
-                title = re.sub(r'\s*\([^)]*\)\s*$', '', line)
+                title = _TRAILING_METADATA_RE.sub('', line)
                 if len(title) < 200 and len(title) > 3:  # Not too long, not too short
                     return title
         
         return f"Article {article_num}"
     
-    def _extract_summary(self, article_text: str) -> str:
-        """Extract summary from article text."""
-        # Remove article header
-        lines = article_text.split('\n')
-        content_lines = []
-        
-        for line in lines:
+    def _extract_summary(self, text: str, start: int, end: int) -> str:
+        """Extract summary from the article spanning text[start:end]."""
+        # Collect the non-empty lines, skipping article header lines and paragraph
+        # markers. Only the first sentence is kept, so the lines collected so far
+        # are tried at growing checkpoints and most articles stop being read after
+        # their first few lines.
+        lines = []
+        length = 0
+        checkpoint = _SUMMARY_CHECKPOINT
+        for line in self._iter_lines(text, start, end):
             line = line.strip()
-            # Skip article header lines and paragraph markers
-            if re.match(r'^(Article|Art\.|Section|ART\.)\s+\d+', line, re.IGNORECASE):
+            if not line or _HEADER_LINE_RE.match(line) or _PARAGRAPH_LINE_RE.match(line):
                 continue
-            if re.match(r'^§\s*\d+', line):
-                continue
-            if line:
-                content_lines.append(line)
+            lines.append(line)
+            length += len(line) + 1
+            if length >= checkpoint:
+                summary = self._summarize(' '.join(lines), complete=False)
+                if summary is not None:
+                    return summary
+                checkpoint *= 2
         
-        # Take first paragraph or first 500 characters
-        content = ' '.join(content_lines)
+        return self._summarize(' '.join(lines), complete=True)
+    
+    def _summarize(self, content: str, complete: bool) -> Optional[str]:
+        """
+        Reduce joined article lines to their first sentence, capped in length.
         
-        # Remove metadata in parentheses at the end of sentences
-        content = re.sub(r'\s*\([^)]*\)\s*', ' ', content)
-        content = re.sub(r'\s+', ' ', content).strip()
+        Args:
+            content: Article lines joined with spaces
+            complete: False if content is only the start of the article
+            
+        Returns:
+            Summary text, or None if content is incomplete and the rest of the
+            article could still change the summary
+        """
+        # An unclosed parenthesis may be metadata that closes further on
+        if not complete and content.rfind('(') > content.rfind(')'):
+            return None
         
-        # Try to find first sentence or paragraph
-        sentences = re.split(r'[.!?]\s+', content)
-        if sentences:
-            summary = sentences[0]
-            if len(summary) > 500:
-                summary = summary[:500] + "..."
-            return summary
+        # Remove metadata in parentheses and collapse whitespace
+        content = _METADATA_OR_SPACE_RE.sub(' ', content).strip()
         
-        # Fallback: first 500 characters
-        if len(content) > 500:
-            return content[:500] + "..."
-        return content
+        # Take the first sentence (or all content if there is no sentence break).
+        # Without a break, more content only matters while the summary would
+        # still fit; a break at the very end needs the following whitespace.
+        match = _SENTENCE_END_RE.search(content)
+        if match is None and not complete and len(content) <= _SUMMARY_MAX_LENGTH + 1:
+            return None
+        summary = content[:match.start()] if match else content
+        if len(summary) > _SUMMARY_MAX_LENGTH:
+            summary = summary[:_SUMMARY_MAX_LENGTH] + "..."
+        return summary
     
     def extract_summary(self, text: str, max_length: int = 500) -> str:
         """
@@ -252,13 +253,8 @@ class Extractor:
             Summary text
         """
         # Try to find introduction or preamble
-        intro_patterns = [
-            r'(?:introduction|preamble|overview|summary)[:\s]+(.+?)(?:\n\n|\n[A-Z])',
-            r'^(.{100,500}?)(?:Article|Section|\n\n)',
-        ]
-        
-        for pattern in intro_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        for pattern in _INTRO_RES:
+            match = pattern.search(text)
             if match:
                 summary = match.group(1).strip()
                 if len(summary) > 50:  # Minimum length
@@ -267,17 +263,11 @@ class Extractor:
                     return summary
         
         # Fallback: first paragraph or first max_length characters
-        paragraphs = text.split('\n\n')
-        if paragraphs:
-            summary = paragraphs[0].strip()
-            if len(summary) > max_length:
-                summary = summary[:max_length] + "..."
-            return summary
-        
-        # Last resort: first max_length characters
-        if len(text) > max_length:
-            return text[:max_length] + "..."
-        return text
+        paragraph_end = text.find('\n\n')
+        summary = (text[:paragraph_end] if paragraph_end != -1 else text).strip()
+        if len(summary) > max_length:
+            summary = summary[:max_length] + "..."
+        return summary
     
     def extract_developer_guidance(self, text: str) -> List[str]:
         """
@@ -300,23 +290,18 @@ class Extractor:
         # - Keyword extraction (encrypt, access control, etc.)
         # - Manual configuration per regulation
         
-        guidance = []
-        
-        # Basic keyword-based extraction (very simple)
-        keywords = {
-            "encrypt": "Encrypt sensitive data",
-            "access control": "Enforce access control",
-            "minimize": "Minimize personal data storage",
-            "audit": "Maintain audit logs",
-            "consent": "Obtain proper consent",
+        text_lower = text.encode("utf-8", "ignore").translate(_ASCII_LOWER)
+        found = {
+            guidance_text
+            for keyword, guidance_text in _GUIDANCE_KEYWORD_BYTES
+            if keyword in text_lower
         }
         
-        text_lower = text.lower()
-        for keyword, guidance_text in keywords.items():
-            if keyword in text_lower:
-                if guidance_text not in guidance:
-                    guidance.append(guidance_text)
-        
-        return guidance
+        # Report guidance in keyword order, not in the order matches occur in the text
+        return [
+            guidance_text
+            for guidance_text in dict.fromkeys(_GUIDANCE_KEYWORDS.values())
+            if guidance_text in found
+        ]
 
 
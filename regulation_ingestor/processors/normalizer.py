@@ -4,6 +4,31 @@ import re
 from typing import Optional
 
 
+# Whitespace and line break cleanup, as plain string substitutions:
+# - runs of tabs, carriage returns, form feeds and vertical tabs become a space
+# - runs of more than 2 spaces collapse to one space
+# - more than 2 consecutive newlines collapse to a blank line
+_CONTROL_RUN_RE = re.compile(r'[\t\r\f\v]+')
+_SPACE_RUN_RE = re.compile(r' {3,}')
+_NEWLINE_RUN_RE = re.compile(r'\n{3,}')
+
+# Single-character cleanup applied after whitespace collapsing: smart quotes to
+# straight quotes, zero-width characters removed, non-breaking spaces to spaces.
+# Applied as str.replace calls, each skipped when its character is absent;
+# str.translate drops to a slow per-character path on any non-ASCII text.
+_CHAR_REPLACEMENTS = (
+    ('\u201c', '"'),
+    ('\u201d', '"'),
+    ('\u2018', "'"),
+    ('\u2019', "'"),
+    ('\u200b', ''),
+    ('\u200c', ''),
+    ('\u200d', ''),
+    ('\ufeff', ''),
+    ('\u00a0', ' '),
+)
+
+
 class Normalizer:
     """Normalizes and cleans extracted text."""
     
@@ -15,63 +40,20 @@ class Normalizer:
         """
         Normalize and clean text content.
         
+        Whitespace and line breaks are handled by three regex substitutions
+        with plain string replacements, quotes and special characters by
+        str.replace calls for the characters that occur.
+        
         Args:
             text: Raw extracted text
             
         Returns:
             Normalized text
         """
-        # Remove excessive whitespace
-        text = self._normalize_whitespace(text)
-        
-        # Normalize line breaks
-        text = self._normalize_line_breaks(text)
-        
-        # Normalize quotes
-        text = self._normalize_quotes(text)
-        
-        # Remove special characters that might interfere
-        text = self._clean_special_chars(text)
-        
+        text = _CONTROL_RUN_RE.sub(' ', text)
+        text = _SPACE_RUN_RE.sub(' ', text)
+        text = _NEWLINE_RUN_RE.sub('\n\n', text)
+        for char, replacement in _CHAR_REPLACEMENTS:
+            if char in text:
+                text = text.replace(char, replacement)
         return text.strip()
-    
-    def _normalize_whitespace(self, text: str) -> str:
-        """Normalize whitespace characters."""
-        # Replace various whitespace characters with standard space
-        text = re.sub(r'[\t\r\f\v]+', ' ', text)
-        
-        # Remove excessive spaces (more than 2 consecutive)
-        text = re.sub(r' {3,}', ' ', text)
-        
-        return text
-    
-    def _normalize_line_breaks(self, text: str) -> str:
-        """Normalize line breaks."""
-        # Normalize different line break styles
-        text = text.replace('\r\n', '\n')  # Windows
-        text = text.replace('\r', '\n')    # Old Mac
-        
-        # Remove excessive newlines (more than 2 consecutive)
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        
-        return text
-    
-    def _normalize_quotes(self, text: str) -> str:
-        """Normalize quote characters."""
-        # Replace smart quotes with straight quotes
-        text = text.replace('"', '"').replace('"', '"')
-        text = text.replace(''', "'").replace(''', "'")
-        
-        return text
-    
-    def _clean_special_chars(self, text: str) -> str:
-        """Clean special characters that might interfere with parsing."""
-        # Remove zero-width characters
-        text = re.sub(r'[\u200b-\u200d\ufeff]', '', text)
-        
-        # Normalize non-breaking spaces
-        text = text.replace('\u00a0', ' ')
-        
-        return text
-
-
@@ -1,7 +1,10 @@
 """Pydantic models for validating regulation data schema."""
 
 from typing import List, Optional
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+_VALID_RISK_CATEGORIES = frozenset({"low", "medium", "high", "critical"})
 
 
 class Article(BaseModel):
@@ -26,10 +29,10 @@ class Regulation(BaseModel):
     @classmethod
     def validate_risk_category(cls, v: str) -> str:
         """Validate risk category."""
-        valid_categories = ["low", "medium", "high", "critical"]
-        if v.lower() not in valid_categories:
+        v = v.lower()
+        if v not in _VALID_RISK_CATEGORIES:
             return "high"  # Default to high
-        return v.lower()
+        return v
     
     @field_validator("articles")
     @classmethod
@@ -46,12 +49,16 @@ class Regulation(BaseModel):
 
 class RegulationSource(BaseModel):
     """Source configuration for a regulation."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     id: str
     sources: List[str] = Field(default_factory=list)
 
 
 class Region(BaseModel):
     """Region configuration."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     id: str
     name: str
     regulations: List[RegulationSource] = Field(default_factory=list)
@@ -59,6 +66,8 @@ class Region(BaseModel):
 
 class RegionsConfig(BaseModel):
     """Root configuration for all regions."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     regions: List[Region] = Field(default_factory=list)
 
 
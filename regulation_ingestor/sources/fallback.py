@@ -1,6 +1,8 @@
 """Fallback orchestration for HTML → PDF → manual extraction pipeline."""
 
-from typing import Optional
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, TextIO
 from pathlib import Path
 from .fetcher import Fetcher
 from .html_parser import HTMLParser
@@ -16,7 +18,7 @@ class Scraper:
         self.html_parser = HTMLParser()
         self.pdf_parser = PDFParser()
     
-    def scrape(self, region_id: str, regulation_id: str, sources: list[str]) -> str:
+    def scrape(self, region_id: str, regulation_id: str, sources: list[str], out: Optional[TextIO] = None) -> str:
         """
         Scrape content from sources with fallback strategy.
         
@@ -25,10 +27,14 @@ class Scraper:
         2. Try PDF sources if HTML fails
         3. If all fail, provide instructions for manual placement
         
+        Each source is parsed as HTML or PDF according to the content type it
+        is served with, whichever group it was listed in.
+        
         Args:
             region_id: Region identifier
             regulation_id: Regulation identifier
             sources: List of source URLs or file paths
+            out: Stream for the manual placement instructions (defaults to stdout)
             
         Returns:
             Extracted raw text content
@@ -46,46 +52,95 @@ class Scraper:
             else:
                 html_sources.append(source)
         
-        # Try HTML sources first
-        for source in html_sources:
-            try:
-                content, content_type = self.fetcher.fetch(source)
-                if "html" in content_type.lower():
-                    text = self.html_parser.parse(content)
-                    if text and len(text.strip()) > 100:  # Minimum content check
-                        return text
-            except Exception as e:
-                continue
-        
-        # Try PDF sources
-        for source in pdf_sources:
-            try:
-                content, content_type = self.fetcher.fetch(source)
-                if "pdf" in content_type.lower():
-                    text = self.pdf_parser.parse(content)
-                    if text and len(text.strip()) > 100:  # Minimum content check
-                        return text
-            except Exception as e:
-                continue
+        # The categories only set the priority (HTML first); each source is
+        # parsed according to the content type it is actually served with
+        ordered_sources = list(dict.fromkeys(html_sources + pdf_sources))
         
-        # Also try HTML sources as PDF (in case of misdetection)
-        for source in html_sources:
+        if ordered_sources:
+            # While a source is parsed, the next one is already being fetched,
+            # so a fallback doesn't start from scratch. Nothing further ahead is
+            # fetched, and once a source succeeds the prefetch is cancelled, so
+            # the common case downloads only what it uses. Each source is
+            # fetched only once; local PDF files are parsed straight from disk.
+            cancel = threading.Event()
+            executor = ThreadPoolExecutor(max_workers=2)
             try:
-                content, content_type = self.fetcher.fetch(source)
-                if "pdf" in content_type.lower():
-                    text = self.pdf_parser.parse(content)
-                    if text and len(text.strip()) > 100:
+                fetches = {}
+                for index, source in enumerate(ordered_sources):
+                    for ahead in ordered_sources[index:index + 2]:
+                        if ahead not in fetches:
+                            fetches[ahead] = self._start_fetch(executor, ahead, cancel)
+                    fetch = fetches[source]
+                    if fetch is None:
+                        text = self._parse_local_pdf(source)
+                    else:
+                        text = self._parse_fetched(fetch)
+                    if text is not None:
                         return text
-            except Exception:
-                pass
+            finally:
+                # Stop the prefetch, if any, instead of waiting for it
+                cancel.set()
+                executor.shutdown(wait=False, cancel_futures=True)
         
         # All sources failed - provide manual instructions
-        self._print_manual_instructions(region_id, regulation_id, sources)
+        self._print_manual_instructions(region_id, regulation_id, sources, out)
         raise Exception(
             f"Failed to extract content from all sources for {region_id}/{regulation_id}. "
             f"See instructions above for manual placement."
         )
     
+    def _start_fetch(self, executor: ThreadPoolExecutor, source: str,
+                     cancel: threading.Event) -> Optional[Future]:
+        """Start fetching a source, or return None for a local PDF file."""
+        if self._is_local_pdf(source):
+            return None
+        return executor.submit(self.fetcher.fetch, source, cancel)
+    
+    def _parse_fetched(self, fetch: Future) -> Optional[str]:
+        """
+        Parse a fetched source with the parser for its content type.
+        
+        Returns:
+            Extracted text, or None if the fetch failed, the content is neither
+            HTML nor PDF, or too little text was extracted
+        """
+        try:
+            content, content_type = fetch.result()
+            content_type = content_type.lower()
+            if "pdf" in content_type:
+                text = self.pdf_parser.parse(content)
+            elif "html" in content_type:
+                text = self.html_parser.parse(content)
+            else:
+                return None
+            return self._check_content(text)
+        except Exception:
+            return None
+    
+    def _parse_local_pdf(self, path: str) -> Optional[str]:
+        """
+        Parse a local PDF file straight from disk.
+        
+        Returns:
+            Extracted text, or None if parsing failed or too little text was
+            extracted
+        """
+        try:
+            return self._check_content(self.pdf_parser.parse_path(path))
+        except Exception:
+            return None
+    
+    def _check_content(self, text: str) -> Optional[str]:
+        """Return the text if it passes the minimum content check, else None."""
+        if text and len(text.strip()) > 100:  # Minimum content check
+            return text
+        return None
+    
+    def _is_local_pdf(self, source: str) -> bool:
+        """Check if source is a PDF file on disk."""
+        path = Path(source)
+        return path.suffix.lower() == ".pdf" and path.is_file()
+    
     def _is_pdf_source(self, source: str) -> bool:
         """Check if source is likely a PDF."""
         source_lower = source.lower()
@@ -95,18 +150,24 @@ class Scraper:
             "/pdf" in source_lower
         )
     
-    def _print_manual_instructions(self, region_id: str, regulation_id: str, sources: list[str]):
+    def _print_manual_instructions(self, region_id: str, regulation_id: str, sources: list[str],
+                                   out: Optional[TextIO] = None):
         """Print instructions for manual PDF placement."""
-        print("\n" + "=" * 70)
-        print(f"MANUAL PLACEMENT REQUIRED: {region_id}/{regulation_id}")
-        print("=" * 70)
-        print("\nAll automated extraction methods failed.")
-        print("\nSource URLs:")
+        # Built as one block and printed at once, so it stays intact even if
+        # out is shared by several concurrent scrapes
+        lines = [
+            "\n" + "=" * 70,
+            f"MANUAL PLACEMENT REQUIRED: {region_id}/{regulation_id}",
+            "=" * 70,
+            "\nAll automated extraction methods failed.",
+            "\nSource URLs:",
+        ]
         for i, source in enumerate(sources, 1):
-            print(f"  {i}. {source}")
-        print("\nPlease manually download the PDF and place it at:")
-        print(f"  ./manual/{region_id}/{regulation_id}.pdf")
-        print("\nThen re-run the scraper.")
-        print("=" * 70 + "\n")
-
-
+            lines.append(f"  {i}. {source}")
+        lines.extend([
+            "\nPlease manually download the PDF and place it at:",
+            f"  ./manual/{region_id}/{regulation_id}.pdf",
+            "\nThen re-run the scraper.",
+            "=" * 70 + "\n",
+        ])
+        print("\n".join(lines), file=out)
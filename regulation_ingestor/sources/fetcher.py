@@ -1,9 +1,20 @@
 """HTTP client for fetching HTML and PDF content."""
 
+import re
+import threading
 import requests
 from pathlib import Path
 from typing import Optional, Tuple
-from urllib.parse import urlparse
+
+
+# Read size for streamed downloads (requests defaults to 10 KB chunks)
+_CHUNK_SIZE = 64 * 1024
+
+_PDF_EXTENSIONS = (".pdf",)
+_HTML_EXTENSIONS = (".html", ".htm")
+
+# HTML markers looked for near the start of local files (ASCII case-insensitive)
+_HTML_MARKER_RE = re.compile(rb"<html|<!doctype", re.IGNORECASE)
 
 
 class Fetcher:
@@ -22,12 +33,13 @@ class Fetcher:
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         })
     
-    def fetch(self, source: str) -> Tuple[bytes, str]:
+    def fetch(self, source: str, cancel: Optional[threading.Event] = None) -> Tuple[bytes, str]:
         """
         Fetch content from URL or local file.
         
         Args:
             source: URL or local file path
+            cancel: Event that, once set, aborts a URL download in progress
             
         Returns:
             Tuple of (content_bytes, content_type)
@@ -41,7 +53,7 @@ class Fetcher:
             return self._fetch_local(source)
         
         # Fetch from URL
-        return self._fetch_url(source)
+        return self._fetch_url(source, cancel)
     
     def _fetch_local(self, file_path: str) -> Tuple[bytes, str]:
         """Fetch content from local file."""
@@ -53,14 +65,24 @@ class Fetcher:
         content_type = self._detect_content_type(path.suffix, content)
         return content, content_type
     
-    def _fetch_url(self, url: str) -> Tuple[bytes, str]:
-        """Fetch content from URL."""
+    def _fetch_url(self, url: str, cancel: Optional[threading.Event] = None) -> Tuple[bytes, str]:
+        """Fetch content from URL, aborting between chunks once cancel is set."""
         try:
-            response = self.session.get(url, timeout=self.timeout, allow_redirects=True)
-            response.raise_for_status()
-            
-            content_type = self._detect_content_type_from_response(url, response)
-            return response.content, content_type
+            # Streamed so the body is read in large chunks, and the connection
+            # goes back to the session's pool as soon as the block exits, even
+            # on errors
+            with self.session.get(url, timeout=self.timeout, allow_redirects=True, stream=True) as response:
+                response.raise_for_status()
+                
+                content_type = self._detect_content_type_from_response(url, response)
+                chunks = []
+                for chunk in response.iter_content(_CHUNK_SIZE):
+                    if cancel is not None and cancel.is_set():
+                        # Closing the unread response drops its connection
+                        raise requests.RequestException("download cancelled")
+                    chunks.append(chunk)
+                content = b"".join(chunks)
+            return content, content_type
             
         except requests.RequestException as e:
             raise requests.RequestException(f"Failed to fetch {url}: {e}")
@@ -80,12 +102,18 @@ class Fetcher:
     
     def _detect_content_type_from_url(self, url: str) -> str:
         """Detect content type from URL extension."""
-        parsed = urlparse(url)
-        path = parsed.path.lower()
+        # Path component of the fetched http(s) URL without urlparse: drop the
+        # fragment and query, then the scheme and host
+        path = url.partition("#")[0].partition("?")[0]
+        scheme_end = path.find("://")
+        if scheme_end != -1:
+            path_start = path.find("/", scheme_end + 3)
+            path = path[path_start:] if path_start != -1 else ""
+        path = path.lower()
         
-        if path.endswith(".pdf"):
+        if path.endswith(_PDF_EXTENSIONS):
             return "application/pdf"
-        if path.endswith((".html", ".htm")):
+        if path.endswith(_HTML_EXTENSIONS):
             return "text/html"
         
         # Default to HTML for web URLs
@@ -95,15 +123,15 @@ class Fetcher:
         """Detect content type from file extension and content."""
         ext = extension.lower()
         
-        if ext == ".pdf":
+        if ext in _PDF_EXTENSIONS:
             return "application/pdf"
-        if ext in (".html", ".htm"):
+        if ext in _HTML_EXTENSIONS:
             return "text/html"
         
-        # Try to detect from content
+        # Try to detect from content, searching the first 1024 bytes in place
         if content.startswith(b"%PDF"):
             return "application/pdf"
-        if b"<html" in content[:1024].lower() or b"<!doctype" in content[:1024].lower():
+        if _HTML_MARKER_RE.search(content, 0, 1024):
             return "text/html"
         
         # Default
@@ -1,8 +1,57 @@
 """HTML parser for extracting text content from web pages."""
 
+import codecs
+import re
+import soupsieve
 from bs4 import BeautifulSoup
 from typing import Optional
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    from charset_normalizer import from_bytes
+except ImportError:
+    from_bytes = None
+
+
+# Byte order marks and the codecs that decode (and drop) them. UTF-32 comes
+# first because its little-endian BOM starts with the UTF-16 one.
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+# Charset declared in a meta tag or XML prolog, looked for in the first 1024 bytes
+_CHARSET_RE = re.compile(rb'charset=["\']?([^"\'\s>]+)', re.IGNORECASE)
+
+
+# Elements removed before extracting text
+_REMOVED_TAGS = ("script", "style", "nav", "header", "footer", "aside")
+
+# Common selectors for main content, in priority order
+_MAIN_CONTENT_SELECTORS = (
+    "main",
+    "article",
+    '[role="main"]',
+    ".content",
+    "#content",
+    ".main-content",
+    "#main-content",
+    ".regulation-content",
+    "#regulation-content",
+)
+
+# For BeautifulSoup: one query for every candidate, then per-selector matchers
+# to pick the candidate of the highest-priority selector
+_MAIN_CONTENT_QUERY = soupsieve.compile(", ".join(_MAIN_CONTENT_SELECTORS))
+_MAIN_CONTENT_MATCHERS = tuple(soupsieve.compile(selector) for selector in _MAIN_CONTENT_SELECTORS)
+
 
 class HTMLParser:
     """Extracts main text content from HTML documents."""
@@ -27,17 +76,42 @@ class HTMLParser:
             encoding = self._detect_encoding(html_content)
         
         # Decode HTML
-        try:
-            html_text = html_content.decode(encoding)
-        except UnicodeDecodeError:
-            # Fallback to UTF-8
-            html_text = html_content.decode("utf-8", errors="ignore")
+        html_text = self._decode(html_content, encoding)
+        
+        if LexborHTMLParser is not None:
+            text = self._extract_text_lexbor(html_text)
+        else:
+            text = self._extract_text_bs4(html_text)
+        
+        # Clean up text
+        text = self._clean_text(text)
+        return text
+    
+    def _extract_text_lexbor(self, html_text: str) -> str:
+        """Extract main text with selectolax's Lexbor parser (C, much faster than bs4)."""
+        tree = LexborHTMLParser(html_text)
         
+        # Remove script and style elements
+        tree.strip_tags(list(_REMOVED_TAGS))
+        
+        # Try to find main content area, falling back to body text
+        for selector in _MAIN_CONTENT_SELECTORS:
+            node = tree.css_first(selector)
+            if node is not None:
+                break
+        else:
+            node = tree.body if tree.body is not None else tree.root
+        
+        # Whitespace-only text nodes come out as empty lines, which _clean_text drops
+        return node.text(separator="\n", strip=True) if node is not None else ""
+    
+    def _extract_text_bs4(self, html_text: str) -> str:
+        """Extract main text with BeautifulSoup's pure-Python parser."""
         # Parse with BeautifulSoup
         soup = BeautifulSoup(html_text, "html.parser")
         
         # Remove script and style elements
-        for element in soup(["script", "style", "nav", "header", "footer", "aside"]):
+        for element in soup(list(_REMOVED_TAGS)):
             element.decompose()
         
         # Try to find main content area
@@ -53,62 +127,55 @@ class HTMLParser:
             else:
                 text = soup.get_text(separator="\n", strip=True)
         
-        # Clean up text
-        text = self._clean_text(text)
         return text
     
     def _find_main_content(self, soup: BeautifulSoup) -> Optional:
         """Find the main content area of the page."""
-        # Common selectors for main content
-        selectors = [
-            "main",
-            "article",
-            '[role="main"]',
-            ".content",
-            "#content",
-            ".main-content",
-            "#main-content",
-            ".regulation-content",
-            "#regulation-content",
-        ]
-        
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element:
-                return element
+        # A single tree walk collects all candidates in document order. Checking
+        # them against each selector in priority order returns the same element
+        # as a select_one() per selector would, without a walk per selector.
+        candidates = _MAIN_CONTENT_QUERY.select(soup)
+        for matcher in _MAIN_CONTENT_MATCHERS:
+            for element in candidates:
+                if matcher.match(element):
+                    return element
         
         return None
     
     def _clean_text(self, text: str) -> str:
         """Clean extracted text."""
-        lines = []
-        for line in text.split("\n"):
-            line = line.strip()
-            if line and len(line) > 2:  # Filter out very short lines
-                lines.append(line)
-        
-        # Join lines and normalize whitespace
-        text = "\n".join(lines)
-        
-        # Remove excessive newlines (more than 2 consecutive)
-        while "\n\n\n" in text:
-            text = text.replace("\n\n\n", "\n\n")
-        
-        return text.strip()
+        # Keep stripped lines longer than 2 characters, which filters out very
+        # short and empty lines. With no empty lines left there are never blank
+        # line runs to collapse, and the joined text has no outer whitespace.
+        return "\n".join(line for line in map(str.strip, text.split("\n")) if len(line) > 2)
     
     def _detect_encoding(self, content: bytes) -> str:
-        """Detect encoding from HTML content."""
-        # Check for charset in first 1024 bytes
-        sample = content[:1024].decode("latin-1", errors="ignore")
+        """Detect encoding from HTML content: BOM, then declared charset, then UTF-8."""
+        for bom, encoding in _BOMS:
+            if content.startswith(bom):
+                return encoding
         
         # Look for charset declaration
-        if "charset=" in sample.lower():
-            import re
-            match = re.search(r'charset=["\']?([^"\'\s>]+)', sample, re.IGNORECASE)
-            if match:
-                return match.group(1).lower()
+        match = _CHARSET_RE.search(content, 0, 1024)
+        if match:
+            return match.group(1).decode("latin-1").lower()
         
         # Default to UTF-8
         return "utf-8"
-
-
+    
+    def _decode(self, content: bytes, encoding: str) -> str:
+        """Decode HTML bytes, guessing the encoding if the given one doesn't work."""
+        try:
+            return content.decode(encoding)
+        except (UnicodeDecodeError, LookupError):
+            # Wrong or unknown encoding name
+            pass
+        
+        # Guess from the bytes themselves when charset-normalizer is available
+        if from_bytes is not None:
+            best = from_bytes(content).best()
+            if best is not None:
+                return str(best)
+        
+        # Fallback to UTF-8
+        return content.decode("utf-8", errors="ignore")
@@ -1,8 +1,95 @@
 """PDF parser for extracting text content from PDF documents."""
 
+import multiprocessing
+import os
+import re
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import chain, repeat
 from pypdf import PdfReader
 from io import BytesIO
-from typing import Optional
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Union
+
+try:
+    import pymupdf
+except ImportError:
+    pymupdf = None
+
+
+# pypdf extraction is spread over worker processes only when the pages left
+# after a timed serial sample are estimated to take at least this long; page
+# cost varies far too much between PDFs for a page count to decide it
+PARALLEL_SAMPLE_PAGES = 4
+PARALLEL_MIN_SECONDS = 2.0
+MAX_PAGE_WORKERS = 4
+
+# Worker pool shared by all parsers, spawned on first use
+_page_pool: Optional[ProcessPoolExecutor] = None
+_page_pool_lock = threading.Lock()
+
+# Encrypted PDFs reference their encryption dictionary from the trailer, which
+# sits at the end of the file
+_ENCRYPT_ENTRY_RE = re.compile(rb"/Encrypt\s*(?:\d+\s+\d+\s+R|<<)")
+_TRAILER_SCAN_SIZE = 4096
+
+
+def _iter_page_texts(pages: Iterable) -> Iterator[str]:
+    """Extract the non-empty texts of pypdf pages, skipping pages that fail."""
+    for page in pages:
+        try:
+            page_text = page.extract_text()
+        except Exception:
+            # Skip pages that fail to extract
+            continue
+        if page_text:
+            yield page_text
+
+
+def _has_encrypt_entry(source: Union[bytes, str]) -> bool:
+    """Check the end of a PDF (raw bytes or a file path) for an /Encrypt entry."""
+    if isinstance(source, bytes):
+        return _ENCRYPT_ENTRY_RE.search(source, max(0, len(source) - _TRAILER_SCAN_SIZE)) is not None
+    with open(source, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        f.seek(max(0, size - _TRAILER_SCAN_SIZE))
+        return _ENCRYPT_ENTRY_RE.search(f.read()) is not None
+
+
+def _open_pypdf(source: Union[bytes, str]) -> PdfReader:
+    """Open a pypdf reader on raw PDF bytes or on a file path."""
+    if isinstance(source, bytes):
+        return PdfReader(BytesIO(source))
+    return PdfReader(source)
+
+
+def _get_page_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the shared page worker pool, spawning it on first use."""
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is None:
+            # Spawned rather than forked, since the pipeline parses from its
+            # own threads
+            context = multiprocessing.get_context("spawn")
+            _page_pool = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+        return _page_pool
+
+
+def _discard_page_pool(pool: ProcessPoolExecutor):
+    """Drop a broken page worker pool so the next call spawns a new one."""
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is pool:
+            _page_pool = None
+    pool.shutdown(wait=False)
+
+
+def _extract_page_range(source: Union[bytes, str], start: int, stop: int) -> List[str]:
+    """Extract the page texts of pages [start, stop); runs in a worker process."""
+    reader = _open_pypdf(source)
+    return list(_iter_page_texts(reader.pages[start:stop]))
 
 
 class PDFParser:
@@ -25,32 +112,56 @@ class PDFParser:
         Raises:
             Exception: If PDF cannot be parsed (encrypted, corrupted, etc.)
         """
-        try:
-            pdf_file = BytesIO(pdf_content)
-            reader = PdfReader(pdf_file)
+        return self._parse(pdf_content)
+    
+    def parse_path(self, path: Union[str, Path]) -> str:
+        """
+        Parse a PDF file on disk and extract text content.
+        
+        The file is read by the PDF library itself, which only loads the parts
+        it needs, instead of being read into memory as a whole first.
+        
+        Args:
+            path: Path to the PDF file
             
-            # Check if PDF is encrypted
-            if reader.is_encrypted:
-                raise Exception("PDF is encrypted and cannot be extracted without password")
+        Returns:
+            Extracted text content
             
-            # Extract text from all pages
-            text_parts = []
-            for page_num, page in enumerate(reader.pages, start=1):
-                try:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(page_text)
-                except Exception as e:
-                    # Skip pages that fail to extract
-                    continue
+        Raises:
+            Exception: If PDF cannot be parsed (encrypted, corrupted, etc.)
+        """
+        return self._parse(str(path))
+    
+    def parse_iter(self, pdf_content: bytes) -> Iterator[str]:
+        """
+        Parse PDF and yield the cleaned text of each page, one page at a time.
+        
+        Pages without text are skipped. Joining the yielded texts with single
+        spaces gives the result of parse(), without ever holding the raw text
+        of all pages at once.
+        
+        Args:
+            pdf_content: Raw PDF bytes
             
-            # Join all pages
-            full_text = "\n\n".join(text_parts)
+        Yields:
+            Cleaned text of each page with text content
             
-            # Clean up text
-            full_text = self._clean_text(full_text)
+        Raises:
+            Exception: If PDF cannot be parsed (encrypted, corrupted, etc.)
+        """
+        try:
+            yield from self._iter_clean_pages(pdf_content)
+        except Exception as e:
+            raise Exception(f"Failed to parse PDF: {e}")
+    
+    def _parse(self, source: Union[bytes, str]) -> str:
+        """Extract and clean the text of a PDF given as raw bytes or a file path."""
+        try:
+            # Pages are cleaned one by one, so whitespace only ever collapses
+            # within a page and the pages join with single spaces
+            full_text = " ".join(self._iter_clean_pages(source))
             
-            if not full_text.strip():
+            if not full_text:
                 raise Exception("No text content extracted from PDF")
             
             return full_text
@@ -58,26 +169,98 @@ class PDFParser:
         except Exception as e:
             raise Exception(f"Failed to parse PDF: {e}")
     
-    def _clean_text(self, text: str) -> str:
-        """Clean extracted PDF text."""
-        lines = []
-        for line in text.split("\n"):
-            line = line.strip()
-            if line:
-                lines.append(line)
+    def _iter_clean_pages(self, source: Union[bytes, str]) -> Iterator[str]:
+        """Yield the cleaned, non-empty text of each page."""
+        if pymupdf is not None:
+            page_texts = self._extract_pages_pymupdf(source)
+        else:
+            page_texts = self._extract_pages_pypdf(source)
+        
+        for page_text in page_texts:
+            page_text = self._clean_text(page_text)
+            if page_text:
+                yield page_text
+    
+    def _extract_pages_pymupdf(self, source: Union[bytes, str]) -> Iterator[str]:
+        """Extract the non-empty page texts with PyMuPDF (MuPDF, in C)."""
+        if isinstance(source, bytes):
+            doc = pymupdf.open(stream=source, filetype="pdf")
+        else:
+            doc = pymupdf.open(source, filetype="pdf")
+        try:
+            # Check if PDF is encrypted
+            if doc.needs_pass:
+                raise Exception("PDF is encrypted and cannot be extracted without password")
+            
+            for page in doc:
+                try:
+                    page_text = page.get_text("text")
+                except Exception:
+                    # Skip pages that fail to extract
+                    continue
+                if page_text:
+                    yield page_text
+        finally:
+            doc.close()
+    
+    def _extract_pages_pypdf(self, source: Union[bytes, str]) -> Iterable[str]:
+        """Extract the non-empty page texts with pypdf (pure Python)."""
+        # pypdf rejects every encrypted PDF below, so spot the common case in the
+        # trailer before parsing the whole cross-reference table
+        if _has_encrypt_entry(source):
+            raise Exception("PDF is encrypted and cannot be extracted without password")
         
-        # Join lines
-        text = "\n".join(lines)
+        reader = _open_pypdf(source)
         
-        # Remove excessive newlines (more than 2 consecutive)
-        while "\n\n\n" in text:
-            text = text.replace("\n\n\n", "\n\n")
+        # Check if PDF is encrypted
+        if reader.is_encrypted:
+            raise Exception("PDF is encrypted and cannot be extracted without password")
         
-        # Normalize whitespace
-        text = " ".join(text.split())  # Replace all whitespace with single space
-        # But preserve paragraph breaks
-        text = text.replace("  ", " ")  # Remove double spaces
+        page_count = len(reader.pages)
+        workers = min(os.cpu_count() or 1, MAX_PAGE_WORKERS)
+        if page_count <= PARALLEL_SAMPLE_PAGES or workers < 2:
+            return _iter_page_texts(reader.pages)
         
-        return text.strip()
-
-
+        # Time a few pages in this process to estimate what the rest will cost
+        started = time.perf_counter()
+        sample_texts = list(_iter_page_texts(reader.pages[:PARALLEL_SAMPLE_PAGES]))
+        page_seconds = (time.perf_counter() - started) / PARALLEL_SAMPLE_PAGES
+        
+        remaining = page_count - PARALLEL_SAMPLE_PAGES
+        if page_seconds * remaining >= PARALLEL_MIN_SECONDS:
+            try:
+                rest = self._extract_pages_parallel(source, PARALLEL_SAMPLE_PAGES, page_count, workers)
+                return chain(sample_texts, rest)
+            except (OSError, BrokenProcessPool):
+                # Worker processes unavailable; extract in this process instead
+                pass
+        
+        return chain(sample_texts, _iter_page_texts(reader.pages[PARALLEL_SAMPLE_PAGES:]))
+    
+    def _extract_pages_parallel(self, source: Union[bytes, str], start: int, stop: int,
+                                workers: int) -> List[str]:
+        """
+        Extract the texts of pages [start, stop) with pypdf on worker processes.
+        
+        Each worker re-opens the PDF (from the file itself when given a path)
+        and extracts one contiguous range of pages, so the results join back in
+        page order. The worker pool is shared across calls, so only the first
+        parallel extraction pays for starting it.
+        """
+        bounds = [start + (stop - start) * i // workers for i in range(workers + 1)]
+        pool = _get_page_pool(workers)
+        try:
+            ranges = pool.map(_extract_page_range, repeat(source), bounds[:-1], bounds[1:])
+            return [text for page_texts in ranges for text in page_texts]
+        except BrokenProcessPool:
+            _discard_page_pool(pool)
+            raise
+    
+    def _clean_text(self, text: str) -> str:
+        """
+        Clean extracted PDF text.
+        
+        Every run of whitespace, line breaks included, collapses to a single
+        space in one split and join over the text.
+        """
+        return " ".join(text.split())
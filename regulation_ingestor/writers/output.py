@@ -1,30 +1,49 @@
 """Output management for writing regulation data to directory structure."""
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
-from ..processors.validator import Regulation, RegionsConfig, Region, RegulationSource
-from .versioning import VersionManager
+from typing import Iterable
+from ..processors.validator import Regulation, RegionsConfig
+from .versioning import VersionManager, _atomic_write_bytes
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Threads for overlapping file writes, shared by all writes of one writer
+IO_WORKERS = 4
 
 
 class OutputWriter:
     """Writes regulation data to the MCP server directory structure."""
     
-    def __init__(self, data_dir: Path):
+    def __init__(self, data_dir: Path, compress_versions: bool = False):
         """
         Initialize output writer.
         
         Args:
             data_dir: Root data directory
+            compress_versions: If True, write versioned files zstd-compressed
+                (requires the zstandard package)
         """
         self.data_dir = data_dir
-        self.version_manager = VersionManager(data_dir)
+        self.version_manager = VersionManager(data_dir, compress_versions=compress_versions)
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        self._io_pool = ThreadPoolExecutor(max_workers=IO_WORKERS)
+    
+    def close(self):
+        """Wait for pending writes and stop the writer's I/O threads."""
+        self._io_pool.shutdown()
     
     def write_regulation(self, regulation: Regulation, region_id: str) -> tuple[Path, Path]:
         """
         Write regulation to both versioned and active files.
         
+        The two files are written concurrently, so their syncs to disk overlap.
+        
         Args:
             regulation: Regulation data to write
             region_id: Region identifier
@@ -32,13 +51,47 @@ class OutputWriter:
         Returns:
             Tuple of (versioned_path, active_path)
         """
-        # Save versioned file
-        versioned_path = self.version_manager.save_versioned(regulation, region_id)
+        versioned_payload, active_payload = self._serialize(regulation)
+        
+        # Save versioned file and update active file
+        versioned = self._io_pool.submit(self.version_manager.save_versioned, regulation, region_id, versioned_payload)
+        active = self._io_pool.submit(self.version_manager.update_active, regulation, region_id, active_payload)
+        
+        return versioned.result(), active.result()
+    
+    def write_many(self, regulations: Iterable[tuple[Regulation, str]]) -> list[tuple[Path, Path]]:
+        """
+        Write several regulations to their versioned and active files.
+        
+        Every regulation is encoded before the first file is written, and all
+        files are then written concurrently on the writer's I/O threads.
         
-        # Update active file
-        active_path = self.version_manager.update_active(regulation, region_id)
+        Args:
+            regulations: Pairs of (regulation, region_id)
+            
+        Returns:
+            List of (versioned_path, active_path) tuples, in input order
+        """
+        encoded = [
+            (regulation, region_id, self._serialize(regulation))
+            for regulation, region_id in regulations
+        ]
         
-        return versioned_path, active_path
+        writes = [
+            (
+                self._io_pool.submit(self.version_manager.save_versioned, regulation, region_id, versioned_payload),
+                self._io_pool.submit(self.version_manager.update_active, regulation, region_id, active_payload),
+            )
+            for regulation, region_id, (versioned_payload, active_payload) in encoded
+        ]
+        return [(versioned.result(), active.result()) for versioned, active in writes]
+    
+    def _serialize(self, regulation: Regulation) -> tuple[bytes, bytes]:
+        """Encode a regulation as (compact versioned JSON, indented active JSON)."""
+        return (
+            self.version_manager.serialize(regulation, compact=True),
+            self.version_manager.serialize(regulation),
+        )
     
     def write_regions_json(self, config: RegionsConfig) -> Path:
         """
@@ -56,8 +109,11 @@ class OutputWriter:
         data = config.model_dump()
         
         # Write with proper formatting
-        with open(regions_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        else:
+            payload = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8") + b"\n"
+        _atomic_write_bytes(regions_path, payload)
         
         return regions_path
     
@@ -68,7 +124,5 @@ class OutputWriter:
         Args:
             region_id: Region identifier
         """
-        region_dir = self.data_dir / region_id
-        region_dir.mkdir(parents=True, exist_ok=True)
-
+        self.version_manager.ensure_region_dir(region_id)
 
@@ -1,50 +1,181 @@
 """Version management for regulation JSON files."""
 
-import json
-from datetime import date
+import os
+import time
+from datetime import date, datetime, timedelta
+from itertools import chain
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 from ..processors.validator import Regulation
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# zstd level for compressed versioned files
+VERSION_COMPRESSION_LEVEL = 3
+
+
+def _atomic_write_bytes(path: Union[str, Path], payload: bytes):
+    """
+    Replace a file's content atomically.
+    
+    The bytes are written and synced to a temporary file next to the target,
+    which is then renamed over it, so a crash or a concurrent reader never sees
+    a partially written file.
+    """
+    tmp_path = os.fspath(path) + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _has_content(path: str, payload: bytes) -> bool:
+    """Check whether a file already holds exactly the given bytes."""
+    try:
+        # A size mismatch settles it without reading the file
+        if os.stat(path).st_size != len(payload):
+            return False
+        with open(path, "rb") as f:
+            return f.read() == payload
+    except OSError:
+        return False
+
 
 class VersionManager:
     """Manages versioned regulation files."""
     
-    def __init__(self, data_dir: Path):
+    def __init__(self, data_dir: Path, compress_versions: bool = False):
         """
         Initialize version manager.
         
         Args:
             data_dir: Root data directory
+            compress_versions: If True, write versioned files zstd-compressed
+                as .json.zst (requires the zstandard package)
+            
+        Raises:
+            ImportError: If compress_versions is set but zstandard is missing
         """
+        if compress_versions and zstandard is None:
+            raise ImportError("Compressing versioned files requires the zstandard package")
         self.data_dir = data_dir
+        self.compress_versions = compress_versions
+        # The write path joins plain strings, which is much cheaper than
+        # building Path objects for every file
+        self._data_dir_str = os.fspath(data_dir)
+        # Region directories already created by this manager
+        self._ensured_dirs: set[str] = set()
+        # (today's ISO date, timestamp of the next midnight), replaced as a
+        # whole so concurrent writers always see a matching pair
+        self._today_cache: tuple[str, float] = ("", 0.0)
     
-    def save_versioned(self, regulation: Regulation, region_id: str) -> Path:
+    def ensure_region_dir(self, region_id: str) -> Path:
+        """
+        Create a region's directory if needed.
+        
+        Each directory is created at most once per manager, so repeated writes
+        to a region don't repeat the mkdir.
+        
+        Args:
+            region_id: Region identifier
+            
+        Returns:
+            Path to the region directory
+        """
+        return Path(self._ensure_region_dir(region_id))
+    
+    def _ensure_region_dir(self, region_id: str) -> str:
+        """ensure_region_dir() returning the directory as a string."""
+        region_dir = os.path.join(self._data_dir_str, region_id)
+        if region_dir not in self._ensured_dirs:
+            os.makedirs(region_dir, exist_ok=True)
+            self._ensured_dirs.add(region_dir)
+        return region_dir
+    
+    def _today_iso(self) -> str:
+        """Today's date in ISO format, recomputed only after midnight passes."""
+        today_iso, day_end = self._today_cache
+        if time.time() >= day_end:
+            today = date.today()
+            today_iso = today.isoformat()
+            day_end = datetime.combine(today + timedelta(days=1), datetime.min.time()).timestamp()
+            self._today_cache = (today_iso, day_end)
+        return today_iso
+    
+    def serialize(self, regulation: Regulation, compact: bool = False) -> bytes:
+        """
+        Encode a regulation as the JSON written to its files.
+        
+        Args:
+            regulation: Regulation data to encode
+            compact: If True, encode without indentation or spaces (the format
+                of versioned files); otherwise indent by 2 (active files)
+            
+        Returns:
+            UTF-8 encoded JSON
+        """
+        if orjson is not None:
+            return orjson.dumps(regulation.model_dump(), option=0 if compact else orjson.OPT_INDENT_2)
+        # pydantic-core serializes the model straight to JSON, without building
+        # the intermediate dict that json.dumps would need
+        return regulation.model_dump_json(indent=None if compact else 2).encode("utf-8")
+    
+    def save_versioned(self, regulation: Regulation, region_id: str, payload: Optional[bytes] = None) -> Path:
         """
         Save a versioned regulation file with date stamp.
         
+        Versioned files are archival snapshots, so they are stored as compact
+        JSON, which is smaller and faster to encode than the indented active
+        file, and zstd-compressed as well if compress_versions is set.
+        
         Args:
             regulation: Regulation data to save
             region_id: Region identifier
+            payload: Regulation already encoded by serialize(compact=True), if
+                available
             
         Returns:
             Path to the versioned file
         """
-        region_dir = self.data_dir / region_id
-        region_dir.mkdir(parents=True, exist_ok=True)
+        region_dir = self._ensure_region_dir(region_id)
         
         # Generate versioned filename
-        today = date.today()
-        versioned_filename = f"{regulation.id}_{today.isoformat()}.json"
-        versioned_path = region_dir / versioned_filename
+        versioned_filename = f"{regulation.id}_{self._today_iso()}.json"
+        if self.compress_versions:
+            versioned_filename += ".zst"
+        versioned_path = os.path.join(region_dir, versioned_filename)
         
         # Save versioned file
-        with open(versioned_path, "w", encoding="utf-8") as f:
-            json.dump(regulation.model_dump(), f, indent=2, ensure_ascii=False)
+        if payload is None:
+            payload = self.serialize(regulation, compact=True)
+        if self.compress_versions:
+            # Compressors are not safe to share between threads, so each write
+            # gets its own
+            payload = zstandard.ZstdCompressor(level=VERSION_COMPRESSION_LEVEL).compress(payload)
+        # Unchanged content (a rerun on the same day) is not rewritten
+        if not _has_content(versioned_path, payload):
+            _atomic_write_bytes(versioned_path, payload)
         
-        return versioned_path
+        return Path(versioned_path)
     
-    def update_active(self, regulation: Regulation, region_id: str) -> Path:
+    def update_active(self, regulation: Regulation, region_id: str, payload: Optional[bytes] = None) -> Path:
         """
         Update the active (latest) regulation file.
         
@@ -54,21 +185,24 @@ class VersionManager:
         Args:
             regulation: Regulation data to save
             region_id: Region identifier
+            payload: Regulation already encoded by serialize(), if available
             
         Returns:
             Path to the active file
         """
-        region_dir = self.data_dir / region_id
-        region_dir.mkdir(parents=True, exist_ok=True)
+        region_dir = self._ensure_region_dir(region_id)
         
         # Active file path
-        active_path = region_dir / f"{regulation.id}.json"
+        active_path = os.path.join(region_dir, f"{regulation.id}.json")
         
         # Save active file (copy of latest version)
-        with open(active_path, "w", encoding="utf-8") as f:
-            json.dump(regulation.model_dump(), f, indent=2, ensure_ascii=False)
+        if payload is None:
+            payload = self.serialize(regulation)
+        # Unchanged content is not rewritten
+        if not _has_content(active_path, payload):
+            _atomic_write_bytes(active_path, payload)
         
-        return active_path
+        return Path(active_path)
     
     def get_latest_version(self, region_id: str, regulation_id: str) -> Optional[Path]:
         """
@@ -85,14 +219,13 @@ class VersionManager:
         if not region_dir.exists():
             return None
         
-        # Find all versioned files for this regulation
-        pattern = f"{regulation_id}_*.json"
-        versioned_files = list(region_dir.glob(pattern))
-        
-        if not versioned_files:
-            return None
+        # Find all versioned files for this regulation, plain or compressed
+        versioned_files = chain(
+            region_dir.glob(f"{regulation_id}_*.json"),
+            region_dir.glob(f"{regulation_id}_*.json.zst"),
+        )
         
-        # Sort by filename (which includes date) to get latest
-        versioned_files.sort(reverse=True)
-        return versioned_files[0]
+        # The greatest filename (which includes the ISO date) is the latest,
+        # found in one pass without listing and sorting all versions
+        return max(versioned_files, key=lambda path: path.name, default=None)
 